@@ -353,6 +353,7 @@ class HilbertSpace(
         self._subsys_by_id_str = {
             obj._id_str: self[index] for index, obj in enumerate(self)
         }
+        self._subsys_index_by_id = {id(obj): index for index, obj in enumerate(self)}
         if interaction_list:
             self.interaction_list = interaction_list
         else:
@@ -527,6 +528,10 @@ class HilbertSpace(
         """
         Return the index of the given subsystem in the HilbertSpace.
         """
+        # fast identity-based lookup; avoids comparing subsystems via __eq__
+        index = self._subsys_index_by_id.get(id(subsys))
+        if index is not None and self._subsystems[index] is subsys:
+            return index
         return self._subsystems.index(subsys)
 
     @property
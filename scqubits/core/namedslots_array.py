@@ -589,7 +589,7 @@ class NamedSlotsNdarray(np.ndarray, Serializable):
 
         typename = "NamedSlotsNdarray"
         io_attributes = None
-        if self.dtype in [np.float_, np.complex_, np.int_]:
+        if np.issubdtype(self.dtype, np.number):
             io_ndarrays: Optional[Dict[str, ndarray]] = {
                 "input_array": self.view(np.ndarray)
             }
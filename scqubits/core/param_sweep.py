@@ -166,8 +166,9 @@ class ParameterSweepBase(ABC, SpectrumLookupMixin):
     def subsystem_count(self) -> int:
         return self.hilbertspace.subsystem_count
 
-    @utils.check_sync_status
     def __getitem__(self, key):
+        if self._out_of_sync:
+            utils.warn_out_of_sync()
         if isinstance(key, str):
             return self._data[key]
 
@@ -905,6 +906,11 @@ class ParameterSweep(  # type:ignore
     num_cpus:
         number of CPU cores requested for computing the sweep
         (default value `settings.NUM_CPUS`)
+    lazy_lookup:
+        if set to True, the map between bare and dressed states is not generated
+        when running the sweep, but only for those parameter points for which it is
+        queried; dispersive coefficients are generated upon first access, but are
+        listed by `keys()` throughout. (default: False)
 
 
     Notes
@@ -941,6 +947,7 @@ class ParameterSweep(  # type:ignore
         autorun: bool = settings.AUTORUN_SWEEP,
         deepcopy: bool = False,
         num_cpus: Optional[int] = None,
+        lazy_lookup: bool = False,
     ) -> None:
         num_cpus = num_cpus or settings.NUM_CPUS
         self._parameters = Parameters(paramvals_by_name)
@@ -948,11 +955,13 @@ class ParameterSweep(  # type:ignore
         self._evals_count = evals_count
         self._update_hilbertspace = self.set_update_func(update_hilbertspace)
         self._subsys_update_info = subsys_update_info
+        self._subsys_update_mask = self._generate_subsys_update_mask()
         self._data: Dict[str, Any] = {}
         self._bare_only = bare_only
         self._ignore_low_overlap = ignore_low_overlap
         self._deepcopy = deepcopy
         self._num_cpus = num_cpus
+        self._lazy_lookup = lazy_lookup
         self.tqdm_disabled = settings.PROGRESSBAR_DISABLED or (num_cpus > 1)
 
         self._out_of_sync = False
@@ -964,6 +973,24 @@ class ParameterSweep(  # type:ignore
         if autorun:
             self.run()
 
+    def __getitem__(self, key):
+        if isinstance(key, str) and self._lookup_computed is not None:
+            self._complete_lazy_data(key)
+        return super().__getitem__(key)
+
+    def _complete_lazy_data(self, key: Optional[str] = None) -> None:
+        """For a lazily generated lookup table, generate the data that is still
+        missing for the entry `key` of the sweep data (all entries if `key` is None).
+        """
+        if key in (None, "dressed_indices"):
+            self._ensure_lookup()
+        if key in (None, "lamb", "chi", "kerr") and self._data["lamb"] is None:
+            (
+                self._data["lamb"],
+                self._data["chi"],
+                self._data["kerr"],
+            ) = self._dispersive_coefficients()
+
     def cause_dispatch(self) -> None:
         initial_parameters = tuple(paramvals[0] for paramvals in self._parameters)
         self._update_hilbertspace(self, *initial_parameters)
@@ -980,6 +1007,8 @@ class ParameterSweep(  # type:ignore
         -------
         IOData
         """
+        if self._lookup_computed is not None:
+            self._complete_lazy_data()
         initdata = {
             "paramvals_by_name": self._parameters.ordered_dict,
             "hilbertspace": self._hilbertspace,
@@ -1003,15 +1032,31 @@ class ParameterSweep(  # type:ignore
             self.cause_dispatch()
         settings.DISPATCH_ENABLED = False
 
+        self._lookup_computed = None
         self._data["bare_evals"], self._data["bare_evecs"] = self._bare_spectrum_sweep()
         if not self._bare_only:
             self._data["evals"], self._data["evecs"] = self._dressed_spectrum_sweep()
-            self._data["dressed_indices"] = self.generate_lookup()
-            (
-                self._data["lamb"],
-                self._data["chi"],
-                self._data["kerr"],
-            ) = self._dispersive_coefficients()
+            if self._lazy_lookup:
+                # lookup data and dispersive coefficients are generated on demand
+                self._data["dressed_indices"] = NamedSlotsNdarray(
+                    np.full(
+                        self._parameters.counts + (self.hilbertspace.dimension,),
+                        -1,
+                        dtype=np.int32,
+                    ),
+                    self._parameters.ordered_dict.copy(),
+                )
+                self._lookup_computed = np.zeros(self._parameters.counts, dtype=bool)
+                # placeholders keep the dispersive coefficients listed by `keys()`
+                for key in ("lamb", "chi", "kerr"):
+                    self._data[key] = None
+            else:
+                self._data["dressed_indices"] = self.generate_lookup()
+                (
+                    self._data["lamb"],
+                    self._data["chi"],
+                    self._data["kerr"],
+                ) = self._dispersive_coefficients()
         if self._deepcopy:
             self._hilbertspace = stored_hilbertspace  # restore original state
         settings.DISPATCH_ENABLED = True
@@ -1035,7 +1080,7 @@ class ParameterSweep(  # type:ignore
         bare_evecs = np.empty((self.subsystem_count,), dtype=object)
 
         for subsys_index, subsystem in enumerate(self.hilbertspace):
-            bare_esys = self._subsys_bare_spectrum_sweep(subsystem)
+            bare_esys = self._subsys_bare_spectrum_sweep(subsys_index, subsystem)
             bare_evals[subsys_index] = NamedSlotsNdarray(
                 np.asarray(bare_esys[..., 0].tolist()),
                 self._parameters.paramvals_by_name,
@@ -1063,21 +1108,45 @@ class ParameterSweep(  # type:ignore
         esys_array[1] = evecs
         return esys_array
 
-    def _paramnames_no_subsys_update(self, subsystem) -> List[str]:
+    def _generate_subsys_update_mask(self) -> ndarray:
+        """Return boolean array of shape (subsystem_count, parameter count), recording
+        which parameters update which subsystems according to `subsys_update_info`.
+        Subsystem indices are resolved here, once, to avoid repeated equality
+        comparisons of subsystems later on."""
+        mask_shape = (self.subsystem_count, len(self._parameters))
         if self._subsys_update_info is None:
-            return []
-        updating_parameters = [
+            return np.ones(mask_shape, dtype=bool)
+        update_mask = np.zeros(mask_shape, dtype=bool)
+        for name, subsystems in self._subsys_update_info.items():
+            # entries for parameters that are not swept, or for subsystems that are
+            # not part of the Hilbert space, have no effect
+            if name not in self._parameters.index_by_name:
+                continue
+            param_index = self._parameters.index_by_name[name]
+            for subsystem in subsystems:
+                try:
+                    subsys_index = self.get_subsys_index(subsystem)
+                except ValueError:
+                    continue
+                update_mask[subsys_index, param_index] = True
+        return update_mask
+
+    def _paramnames_no_subsys_update(self, subsys_index: int) -> List[str]:
+        return [
             name
-            for name in self._subsys_update_info.keys()
-            if subsystem in self._subsys_update_info[name]
+            for name, updates in zip(
+                self._parameters.names, self._subsys_update_mask[subsys_index]
+            )
+            if not updates
         ]
-        return list(set(self._parameters.names) - set(updating_parameters))
 
-    def _subsys_bare_spectrum_sweep(self, subsystem) -> ndarray:
+    def _subsys_bare_spectrum_sweep(self, subsys_index: int, subsystem) -> ndarray:
         """
 
         Parameters
         ----------
+        subsys_index:
+            index of the subsystem within the Hilbert space
         subsystem:
             subsystem for which the bare spectrum sweep is to be computed
 
@@ -1086,7 +1155,7 @@ class ParameterSweep(  # type:ignore
             multidimensional array of the format
             array[p1, p2, p3, ..., pN] = np.asarray[[evals, evecs]]
         """
-        fixed_paramnames = self._paramnames_no_subsys_update(subsystem)
+        fixed_paramnames = self._paramnames_no_subsys_update(subsys_index)
         reduced_parameters = self._parameters.create_reduced(fixed_paramnames)
         total_count = np.prod([len(param_vals) for param_vals in reduced_parameters])
 
@@ -1235,14 +1304,19 @@ class ParameterSweep(  # type:ignore
         self,
     ) -> Tuple[NamedSlotsNdarray, NamedSlotsNdarray, NamedSlotsNdarray]:
         energy_0 = self[:].energy_by_dressed_index(0).toarray()
+        hilbertspace = self.hilbertspace
+        osc_subsys_list = self.osc_subsys_list
+        qbt_subsys_list = self.qbt_subsys_list
+        paramvals_by_name = self._parameters.paramvals_by_name
+        energies_1 = [self._energies_1(subsys) for subsys in hilbertspace]
 
         lamb_data = np.empty(self.subsystem_count, dtype=object)
         kerr_data = np.empty((self.subsystem_count, self.subsystem_count), dtype=object)
         chi_data = np.empty((self.subsystem_count, self.subsystem_count), dtype=object)
 
         # Lamb shifts
-        for subsys_index1, subsys1 in enumerate(self.hilbertspace):
-            energy_subsys1_all_l1 = self._energies_1(subsys1)
+        for subsys_index1, subsys1 in enumerate(hilbertspace):
+            energy_subsys1_all_l1 = energies_1[subsys_index1]
             bare_energy_subsys1_all_l1 = self["bare_evals"][subsys_index1].toarray()
             lamb_subsys1_all_l1 = (
                 energy_subsys1_all_l1
@@ -1251,14 +1325,14 @@ class ParameterSweep(  # type:ignore
                 + bare_energy_subsys1_all_l1[..., 0][..., None]
             )
             lamb_data[subsys_index1] = NamedSlotsNdarray(
-                lamb_subsys1_all_l1, self._parameters.paramvals_by_name
+                lamb_subsys1_all_l1, paramvals_by_name
             )
 
         # Kerr and ac Stark
-        for subsys_index1, subsys1 in enumerate(self.hilbertspace):
-            energy_subsys1_all_l1 = self._energies_1(subsys1)
-            for subsys_index2, subsys2 in enumerate(self.hilbertspace):
-                energy_subsys2_all_l2 = self._energies_1(subsys2)
+        for subsys_index1, subsys1 in enumerate(hilbertspace):
+            energy_subsys1_all_l1 = energies_1[subsys_index1]
+            for subsys_index2, subsys2 in enumerate(hilbertspace):
+                energy_subsys2_all_l2 = energies_1[subsys_index2]
                 energy_subsys1_subsys2_all_l1_l2 = self._energies_2(subsys1, subsys2)
                 kerr_subsys1_subsys2_all_l1_l2 = (
                     energy_subsys1_subsys2_all_l1_l2
@@ -1268,35 +1342,33 @@ class ParameterSweep(  # type:ignore
                 )
 
                 # self-Kerr and cross-Kerr: oscillator modes
-                if subsys1 in self.osc_subsys_list and subsys2 in self.osc_subsys_list:
+                if subsys1 in osc_subsys_list and subsys2 in osc_subsys_list:
                     if subsys1 is subsys2:
                         # oscillator self-Kerr
                         kerr_subsys1_subsys2_all_l1_l2 /= 2.0  # osc self-Kerr: 1/2
                     kerr_data[subsys_index1, subsys_index2] = NamedSlotsNdarray(
                         kerr_subsys1_subsys2_all_l1_l2[..., 1, 1],
-                        self._parameters.paramvals_by_name,
+                        paramvals_by_name,
                     )
                     chi_data[subsys_index1, subsys_index2] = np.asarray([])
                 # self-Kerr and cross-Kerr: qubit modes
-                elif (
-                    subsys1 in self.qbt_subsys_list and subsys2 in self.qbt_subsys_list
-                ):
+                elif subsys1 in qbt_subsys_list and subsys2 in qbt_subsys_list:
                     kerr_data[subsys_index1, subsys_index2] = NamedSlotsNdarray(
                         kerr_subsys1_subsys2_all_l1_l2,
-                        self._parameters.paramvals_by_name,
+                        paramvals_by_name,
                     )
                     chi_data[subsys_index1, subsys_index2] = np.asarray([])
                 # ac Stark shifts
                 else:
-                    if subsys1 in self.qbt_subsys_list:
+                    if subsys1 in qbt_subsys_list:
                         chi_data[subsys_index1, subsys_index2] = NamedSlotsNdarray(
                             kerr_subsys1_subsys2_all_l1_l2[..., 1, :],
-                            self._parameters.paramvals_by_name,
+                            paramvals_by_name,
                         )
                     else:
                         chi_data[subsys_index1, subsys_index2] = NamedSlotsNdarray(
                             kerr_subsys1_subsys2_all_l1_l2[..., :, 1],
-                            self._parameters.paramvals_by_name,
+                            paramvals_by_name,
                         )
                     kerr_data[subsys_index1, subsys_index2] = np.asarray([])
 
@@ -1333,6 +1405,16 @@ class StoredSweep(
         self._evals_count = evals_count
         self._data = _data
 
+        dressed_indices = self._data.get("dressed_indices")
+        if dressed_indices is not None and dressed_indices.dtype == object:
+            # lookup data written by earlier versions marks failed lookups by None
+            self._data["dressed_indices"] = NamedSlotsNdarray(
+                np.where(np.equal(dressed_indices, None), -1, dressed_indices).astype(
+                    np.int32
+                ),
+                self._parameters.ordered_dict.copy(),
+            )
+
         self._out_of_sync = False
         self._current_param_indices: NpIndices = slice(None, None, None)
 
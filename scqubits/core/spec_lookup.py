@@ -10,10 +10,10 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
-import itertools
+import functools
 import numbers
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import qutip as qt
@@ -24,7 +24,6 @@ from typing_extensions import Protocol
 
 import scqubits.settings as settings
 import scqubits.utils.misc as utils
-import scqubits.utils.spectrum_utils as spec_utils
 
 from scqubits.core.namedslots_array import NamedSlotsNdarray
 from scqubits.utils.typedefs import NpIndexTuple, NpIndices
@@ -38,6 +37,88 @@ if TYPE_CHECKING:
     from scqubits.utils.typedefs import QuantumSys
 
 
+def _greedy_dressed_indices_loop(
+    overlaps_sq: ndarray, threshold: float, ignore_low_overlap: bool
+) -> ndarray:
+    """
+    Explicit-loop version of the greedy assignment of dressed states to bare product
+    states performed by `_greedy_dressed_indices_numpy`, meant for compilation with
+    numba. Rows of `overlaps_sq` refer to dressed states, columns to bare product
+    states.
+    """
+    evals_count, dim = overlaps_sq.shape
+    dressed_indices = np.full(dim, -1, dtype=np.int32)
+    assigned = np.zeros(dim, dtype=np.bool_)
+    for dressed_index in range(evals_count):
+        max_position = 0
+        max_overlap = -1.0
+        for position in range(dim):
+            overlap = overlaps_sq[dressed_index, position]
+            if assigned[position]:
+                overlap = 0.0
+            if overlap > max_overlap:
+                max_overlap = overlap
+                max_position = position
+        if ignore_low_overlap or max_overlap > threshold:
+            assigned[max_position] = True
+            dressed_indices[max_position] = dressed_index
+    return dressed_indices
+
+
+def _greedy_dressed_indices_numpy(
+    overlaps_sq: ndarray, threshold: float, ignore_low_overlap: bool
+) -> ndarray:
+    """
+    Assign dressed states to bare product states one at a time, in order of
+    dressed-state index, removing bare states from consideration once they have
+    been assigned. Rows of `overlaps_sq` refer to dressed states, columns to bare
+    product states.
+    """
+    overlaps_sq = overlaps_sq.copy()
+    dressed_indices = np.full(overlaps_sq.shape[-1], -1, dtype=np.int32)
+    for dressed_index in range(len(overlaps_sq)):
+        max_position = overlaps_sq[dressed_index].argmax()
+        max_overlap = overlaps_sq[dressed_index, max_position]
+        if ignore_low_overlap or max_overlap > threshold:
+            overlaps_sq[:, max_position] = 0
+            dressed_indices[max_position] = dressed_index
+    return dressed_indices
+
+
+@functools.lru_cache(maxsize=None)
+def _greedy_dressed_indices_jit() -> Optional[Callable]:
+    """
+    Return the numba-compiled version of `_greedy_dressed_indices_loop`, or None if
+    numba is not available. numba is only imported once the greedy assignment is
+    first needed, since importing it noticeably slows down `import scqubits`.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(cache=True)(_greedy_dressed_indices_loop)
+
+
+def _fill_squared_overlaps(evecs: ndarray, out: ndarray) -> None:
+    """
+    Write the squared magnitudes of the components of the given qutip eigenvectors
+    into the rows of the single-precision array `out`, without forming an
+    intermediate complex array for the full set of eigenvectors. Only the ordering
+    of these values and their comparison with the overlap threshold matter for the
+    lookup, so single precision is sufficient and halves the memory traffic.
+    """
+    if len(evecs) != len(out):
+        raise ValueError(
+            "Expected {} eigenvectors, found {}.".format(len(out), len(evecs))
+        )
+    scratch = np.empty(out.shape[-1], dtype=np.float32)
+    for row, evec in zip(out, evecs):
+        components = evec.full()[:, 0]
+        np.square(components.real, out=row, casting="same_kind")
+        np.square(components.imag, out=scratch, casting="same_kind")
+        row += scratch
+
+
 class MixinCompatible(Protocol):
     _parameters: "WatchedProperty[Parameters]"
     _evals_count: "WatchedProperty[int]"
@@ -63,6 +144,10 @@ class SpectrumLookupMixin(MixinCompatible):
     """
 
     _inside_hilbertspace = False
+    _bare_labels_dims: Optional[Tuple[int, ...]] = None
+    _bare_labels: ndarray = np.empty((0, 0), dtype=int)
+    _bare_label_strides: Tuple[int, ...] = ()
+    _lookup_computed: Optional[ndarray] = None
 
     def __init_subclass__(cls):
         super().__init_subclass__()
@@ -89,7 +174,49 @@ class SpectrumLookupMixin(MixinCompatible):
          ...
          (max_1,0), (max_1,1), (max_1,2), ..., (max_1,max_2)]
         """
-        return list(np.ndindex(*self.hilbertspace.subsystem_dims))
+        return list(map(tuple, self._bare_labels_array.tolist()))
+
+    def _update_bare_labels(self) -> None:
+        """
+        Regenerate the array of bare-state labels and the mixed-radix strides used
+        to compute label positions, unless subsystem dimensions are unchanged since
+        the last call.
+        """
+        dims = tuple(self.hilbertspace.subsystem_dims)
+        if dims == self._bare_labels_dims:
+            return
+        self._bare_labels = np.stack(
+            np.meshgrid(*[np.arange(dim) for dim in dims], indexing="ij"), axis=-1
+        ).reshape(-1, len(dims))
+        self._bare_label_strides = tuple(np.cumprod((1,) + dims[:0:-1])[::-1].tolist())
+        self._bare_labels_dims = dims
+
+    @property
+    def _bare_labels_array(self) -> ndarray:
+        """
+        Integer array of shape (dimension, subsystem_count) holding the bare-state
+        labels in canonical order, one label per row.
+        """
+        self._update_bare_labels()
+        return self._bare_labels
+
+    def _bare_label_position(self, bare_labels: Tuple[int, ...]) -> Optional[int]:
+        """
+        Return the position of the given bare-state labels within the canonical
+        ordering of bare product states, or None if the labels are invalid. Since
+        the ordering is lexicographic, the position is given by the mixed-radix
+        number with digits `bare_labels` and radices set by the subsystem dimensions.
+        """
+        self._update_bare_labels()
+        dims = self._bare_labels_dims
+        if len(bare_labels) != len(dims):
+            return None
+        position = 0
+        for label, dim, stride in zip(bare_labels, dims, self._bare_label_strides):
+            if not (0 <= label < dim and label == int(label)):
+                return None
+            position += int(label) * stride
+        return position
 
     def generate_lookup(self) -> NamedSlotsNdarray:
         """
@@ -99,55 +226,138 @@ class SpectrumLookupMixin(MixinCompatible):
 
         Returns
         -------
-            each list item is a list of dressed indices whose order corresponds to the
+            integer array of dressed indices, the last axis ordered according to the
             ordering of bare indices (as stored in .canonical_bare_labels,
-            thus establishing the mapping)
+            thus establishing the mapping); bare states without a matching dressed
+            state are marked by -1
         """
-        dressed_indices = np.empty(shape=self._parameters.counts, dtype=object)
-
-        param_indices = itertools.product(*map(range, self._parameters.counts))
-        for index in param_indices:
-            dressed_indices[index] = self._generate_single_mapping(index)
-        dressed_indices = np.asarray(dressed_indices[:].tolist())
-
+        param_count = np.prod(self._parameters.counts, dtype=int)
+        dressed_indices = self._generate_mappings(np.arange(param_count)).reshape(
+            self._parameters.counts + (self.hilbertspace.dimension,)
+        )
         parameter_dict = self._parameters.ordered_dict.copy()
         return NamedSlotsNdarray(dressed_indices, parameter_dict)
 
-    def _generate_single_mapping(
-        self,
-        param_indices: Tuple[int, ...],
-    ) -> ndarray:
+    def _generate_mappings(self, param_positions: ndarray) -> ndarray:
         """
-        For a single set of parameter values, specified by a tuple of indices
-        ``param_indices``, create an array of the dressed-state indices in an order
-        that corresponds one to one to the bare product states with largest overlap
-        (whenever possible).
+        For each of the given sets of parameter values, create an array of the
+        dressed-state indices in an order that corresponds one to one to the bare
+        product states with largest overlap (whenever possible).
 
         Parameters
         ----------
-        param_indices:
-            indices of the parameter values
+        param_positions:
+            integer array of positions of the parameter values within the flattened
+            (C-ordered) array of parameter-value combinations
+
+        Returns
+        -------
+            integer array of shape (len(param_positions), dimension) holding the
+            dressed-state indices, -1 where no dressed state could be assigned
+        """
+        evecs = np.asarray(self._data["evecs"]).ravel()
+        # the number and dimension of the stored eigenvectors may differ from
+        # `_evals_count` and the current Hilbert space dimension, e.g., after
+        # changing subsystem dimensions
+        evals_count = len(evecs[0])
+        dim = evecs[0][0].shape[0]
+        dressed_indices = np.empty((len(param_positions), dim), dtype=np.int32)
+        if len(param_positions) == 0:
+            return dressed_indices
+
+        # process parameter points in batches to bound peak memory usage; the buffer
+        # of squared overlaps is reused for all batches
+        batch_size = max(1, settings.LOOKUP_BATCH_MEMORY // (evals_count * dim * 4))
+        batch_size = min(batch_size, len(param_positions))
+        overlaps_sq = np.empty((batch_size, evals_count, dim), dtype=np.float32)
+        for start in range(0, len(param_positions), batch_size):
+            stop = min(start + batch_size, len(param_positions))
+            for buffer_index, position in enumerate(param_positions[start:stop]):
+                _fill_squared_overlaps(evecs[position], overlaps_sq[buffer_index])
+            dressed_indices[start:stop] = self._dressed_indices_from_overlaps(
+                overlaps_sq[: stop - start]
+            )
+        return dressed_indices
+
+    def _ensure_lookup(self, param_indices: NpIndexTuple = ()) -> None:
+        """
+        If the lookup table is generated lazily, generate the map between bare and
+        dressed states for all parameter points selected by `param_indices` which
+        have not been processed yet. (No-op for eagerly generated lookup tables.)
+        """
+        if self._lookup_computed is None:
+            return
+        pending = np.zeros_like(self._lookup_computed)
+        pending[param_indices] = True
+        pending &= ~self._lookup_computed
+        if not pending.any():
+            return
+        pending_positions = np.flatnonzero(pending)
+        pending_indices = np.unravel_index(pending_positions, pending.shape)
+        dressed_indices = np.asarray(self._data["dressed_indices"])
+        dressed_indices[pending_indices] = self._generate_mappings(pending_positions)
+        self._lookup_computed |= pending
+
+    def _dressed_indices_from_overlaps(self, overlaps_sq: ndarray) -> ndarray:
+        """
+        Assign dressed states to bare product states for a stack of matrices of
+        squared overlaps, one per set of parameter values.
+
+        Parameters
+        ----------
+        overlaps_sq:
+            array of shape (param_count, evals_count, dimension); each row holds the
+            squared magnitudes of overlaps between one dressed state and all bare
+            product states
 
         Returns
         -------
-            dressed-state indices
+            array of shape (param_count, dimension) of dressed-state indices, -1 where
+            no dressed state could be assigned
         """
-        overlap_matrix = spec_utils.convert_evecs_to_ndarray(
-            self._data["evecs"][param_indices]
+        param_count, evals_count, dim = overlaps_sq.shape
+        dressed_indices = np.full((param_count, dim), -1, dtype=np.int32)
+
+        # Fast path: one argmax per dressed state over all bare product states. As
+        # long as no two accepted dressed states share the same bare state, the
+        # greedy assignment below would produce exactly the same result.
+        max_positions = overlaps_sq.argmax(axis=-1)
+        max_overlaps = np.take_along_axis(
+            overlaps_sq, max_positions[..., None], axis=-1
+        )[..., 0]
+        if self._ignore_low_overlap:
+            accepted = np.ones_like(max_positions, dtype=bool)
+        else:
+            accepted = max_overlaps > settings.OVERLAP_THRESHOLD
+        # rejected dressed states are given distinct dummy positions beyond `dim`
+        sorted_positions = np.sort(
+            np.where(accepted, max_positions, dim + np.arange(evals_count)), axis=-1
         )
+        collision = np.any(np.diff(sorted_positions, axis=-1) == 0, axis=-1)
 
-        dim = self.hilbertspace.dimension
-        dressed_indices: List[Union[int, None]] = [None] * dim
-        for dressed_index in range(self._evals_count):
-            max_position = (np.abs(overlap_matrix[dressed_index, :])).argmax()
-            max_overlap = np.abs(overlap_matrix[dressed_index, max_position])
-            if self._ignore_low_overlap or (
-                max_overlap**2 > settings.OVERLAP_THRESHOLD
-            ):
-                overlap_matrix[:, max_position] = 0
-                dressed_indices[int(max_position)] = dressed_index
+        param_index, dressed_index = np.nonzero(accepted & ~collision[:, None])
+        bare_position = max_positions[param_index, dressed_index]
+        dressed_indices[param_index, bare_position] = dressed_index
 
-        return np.asarray(dressed_indices)
+        # Slow path: greedy assignment wherever bare states are contested
+        for param_index in np.flatnonzero(collision):
+            dressed_indices[param_index] = self._greedy_dressed_indices(
+                overlaps_sq[param_index]
+            )
+        return dressed_indices
+
+    def _greedy_dressed_indices(self, overlaps_sq: ndarray) -> ndarray:
+        """
+        Assign dressed states to bare product states one at a time, in order of
+        dressed-state index, removing bare states from consideration once they have
+        been assigned. `overlaps_sq` has shape (evals_count, dimension).
+        """
+        greedy_dressed_indices = (
+            _greedy_dressed_indices_jit() or _greedy_dressed_indices_numpy
+        )
+        return greedy_dressed_indices(
+            overlaps_sq, settings.OVERLAP_THRESHOLD, self._ignore_low_overlap
+        )
 
     def set_npindextuple(
         self, param_indices: Optional[NpIndices] = None
@@ -158,7 +368,6 @@ class SpectrumLookupMixin(MixinCompatible):
         return param_indices
 
     @utils.check_lookup_exists
-    @utils.check_sync_status
     def dressed_index(
         self,
         bare_labels: Tuple[int, ...],
@@ -176,17 +385,52 @@ class SpectrumLookupMixin(MixinCompatible):
 
         Returns
         -------
-            dressed state index closest to the specified bare state
+            dressed state index closest to the specified bare state; None if no
+            such state exists. If multiple parameter values are selected, an array of
+            dressed indices is returned, with -1 marking failed lookups.
         """
+        if self._out_of_sync:
+            utils.warn_out_of_sync()
         param_indices = self.set_npindextuple(param_indices)
-        try:
-            lookup_position = self._bare_product_states_labels.index(bare_labels)
-        except ValueError:
+        lookup_position = self._bare_label_position(bare_labels)
+        if lookup_position is None:
             return None
-        return self._data["dressed_indices"][param_indices + (lookup_position,)]
+        self._ensure_lookup(param_indices)
+        dressed_index = self._data["dressed_indices"][
+            param_indices + (lookup_position,)
+        ]
+        if isinstance(dressed_index, ndarray) and dressed_index.ndim > 0:
+            return dressed_index
+        return None if dressed_index == -1 else int(dressed_index)
+
+    @utils.check_lookup_exists
+    def dressed_indices_array(
+        self,
+        param_indices: Optional[NpIndices] = None,
+    ) -> ndarray:
+        """
+        Return the dressed-state indices for all bare product states at once,
+        avoiding repeated calls of `dressed_index` for individual bare states.
+
+        Parameters
+        ----------
+        param_indices:
+            indices of parameter values of interest
+
+        Returns
+        -------
+            integer array of dressed indices; the last axis runs over all bare product
+            states in canonical order (lexicographic in the bare-state labels),
+            preceding axes over the selected parameter values; -1 marks failed
+            lookups
+        """
+        if self._out_of_sync:
+            utils.warn_out_of_sync()
+        param_indices = self.set_npindextuple(param_indices)
+        self._ensure_lookup(param_indices)
+        return self._data["dressed_indices"][param_indices]
 
     @utils.check_lookup_exists
-    @utils.check_sync_status
     def bare_index(
         self,
         dressed_index: int,
@@ -201,12 +445,15 @@ class SpectrumLookupMixin(MixinCompatible):
             is in bare state 1, subsystem 2 in bare state 0,
             and subsystem 3 in bare state 3.
         """
+        if self._out_of_sync:
+            utils.warn_out_of_sync()
         param_index_tuple = self.set_npindextuple(param_indices)
         if not self.all_params_fixed(param_index_tuple):
             raise ValueError(
                 "All parameters must be fixed to concrete values for "
                 "the use of `.bare_index`."
             )
+        self._ensure_lookup(param_index_tuple)
         try:
             lookup_position = np.where(
                 self._data["dressed_indices"][param_index_tuple] == dressed_index
@@ -216,10 +463,9 @@ class SpectrumLookupMixin(MixinCompatible):
                 "Could not identify a bare index for the given dressed "
                 "index {}.".format(dressed_index)
             )
-        basis_labels = self._bare_product_states_labels[lookup_position]
-        return basis_labels
+        basis_labels = self._bare_labels_array[lookup_position]
+        return tuple(basis_labels.tolist())
 
-    @utils.check_sync_status
     def eigensys(
         self,
         param_indices: Optional[Tuple[int, ...]] = None,
@@ -237,10 +483,11 @@ class SpectrumLookupMixin(MixinCompatible):
             dressed eigensystem for the external parameter fixed to the value indicated
             by the provided index
         """
+        if self._out_of_sync:
+            utils.warn_out_of_sync()
         param_index_tuple = self.set_npindextuple(param_indices)
         return self._data["evecs"][param_index_tuple]
 
-    @utils.check_sync_status
     def eigenvals(
         self,
         param_indices: Optional[Tuple[int, ...]] = None,
@@ -257,11 +504,12 @@ class SpectrumLookupMixin(MixinCompatible):
             dressed eigenenergies for the external parameters fixed to the values
             indicated by the provided indices
         """
+        if self._out_of_sync:
+            utils.warn_out_of_sync()
         param_indices_tuple = self.set_npindextuple(param_indices)
         return self._data["evals"][param_indices_tuple]
 
     @utils.check_lookup_exists
-    @utils.check_sync_status
     def energy_by_bare_index(
         self,
         bare_tuple: Tuple[int, ...],
@@ -284,36 +532,34 @@ class SpectrumLookupMixin(MixinCompatible):
         -------
             dressed energies, if lookup successful, otherwise nan;
         """
+        if self._out_of_sync:
+            utils.warn_out_of_sync()
         param_indices = self.set_npindextuple(param_indices)
         dressed_index = self.dressed_index(bare_tuple, param_indices)
 
         if dressed_index is None:
             return np.nan  # type:ignore
         if isinstance(dressed_index, numbers.Number):
-            energy = self["evals"][param_indices + (dressed_index,)]
+            evals = self["evals"]
+            energy = evals[param_indices + (dressed_index,)]
             if subtract_ground:
-                energy -= self["evals"][param_indices + (0,)]
+                energy -= evals[param_indices + (0,)]
             return energy
 
         dressed_index = np.asarray(dressed_index)
-        energies = np.empty_like(dressed_index, dtype=np.float_)
-        it = np.nditer(dressed_index, flags=["multi_index", "refs_ok"])
         sliced_energies = self["evals"][param_indices]
-
-        for location in it:
-            location = location.tolist()
-            if location is None:
-                energies[it.multi_index] = np.nan
-            else:
-                energies[it.multi_index] = sliced_energies[it.multi_index][location]
-                if subtract_ground:
-                    energies[it.multi_index] -= sliced_energies[it.multi_index][0]
+        evals = np.asarray(sliced_energies)
+        energies = np.take_along_axis(
+            evals, np.maximum(dressed_index, 0)[..., None], axis=-1
+        )[..., 0]
+        if subtract_ground:
+            energies = energies - evals[..., 0]
+        energies = np.where(dressed_index == -1, np.nan, energies)
         return NamedSlotsNdarray(
             energies, sliced_energies._parameters.paramvals_by_name
         )
 
     @utils.check_lookup_exists
-    @utils.check_sync_status
     def energy_by_dressed_index(
         self,
         dressed_index: int,
@@ -337,6 +583,8 @@ class SpectrumLookupMixin(MixinCompatible):
         -------
             dressed energy
         """
+        if self._out_of_sync:
+            utils.warn_out_of_sync()
         param_indices_tuple = self.set_npindextuple(param_indices)
         energies = self["evals"][param_indices_tuple + (dressed_index,)]
         if subtract_ground:
@@ -344,7 +592,6 @@ class SpectrumLookupMixin(MixinCompatible):
         return energies
 
     @utils.check_lookup_exists
-    @utils.check_sync_status
     def bare_eigenstates(
         self,
         subsys: "QuantumSys",
@@ -355,13 +602,14 @@ class SpectrumLookupMixin(MixinCompatible):
         Eigenstates are expressed in the basis internal to the subsystems. Usually to be
         used with pre-slicing when part of `ParameterSweep`.
         """
+        if self._out_of_sync:
+            utils.warn_out_of_sync()
         param_indices_tuple = self.set_npindextuple(param_indices)
         subsys_index = self.hilbertspace.get_subsys_index(subsys)
         self.reset_preslicing()
         return self["bare_evecs"][subsys_index][param_indices_tuple]
 
     @utils.check_lookup_exists
-    @utils.check_sync_status
     def bare_eigenvals(
         self,
         subsys: "QuantumSys",
@@ -383,6 +631,8 @@ class SpectrumLookupMixin(MixinCompatible):
             bare eigenenergies for the specified subsystem and the external parameter
             fixed to the value indicated by its index
         """
+        if self._out_of_sync:
+            utils.warn_out_of_sync()
         param_indices_tuple = self.set_npindextuple(param_indices)
         subsys_index = self.hilbertspace.get_subsys_index(subsys)
         self.reset_preslicing()
@@ -142,6 +142,10 @@ T1_DEFAULT_WARNING = True
 # (lookups need to be manually regenerated for a change by the user to take effect
 OVERLAP_THRESHOLD = 0.5
 
+# Approximate memory budget (in bytes) for the overlap data processed in one batch when
+# generating the map between dressed states and bare product states
+LOOKUP_BATCH_MEMORY = 2**28
+
 # Settings for Circuit and SymbolicCircuit class.
 # The following determines the threshold for the number of nodes above which the
 # symbolic inversion of the capacitance matrix is skipped.
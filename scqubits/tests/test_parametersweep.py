@@ -130,6 +130,34 @@ class TestParameterSweep:
         )
         assert np.allclose(reference_evals, calculated_evals)
 
+    def test_ParameterSweep_ignores_unused_subsys_update_info(self, num_cpus):
+        tmon = scq.Transmon(EJ=5.0, EC=1.0, ng=0.0, ncut=20, truncated_dim=3)
+        resonator = scq.Oscillator(E_osc=5.0, truncated_dim=3)
+        hilbertspace = scq.HilbertSpace([tmon, resonator])
+        hilbertspace.add_interaction(
+            g_strength=0.1,
+            op1=tmon.n_operator,
+            op2=resonator.creation_operator,
+            add_hc=True,
+        )
+        unrelated_tmon = scq.Transmon(EJ=20.0, EC=0.3, ng=0.0, ncut=20)
+
+        def update_hilbertspace(ng):
+            tmon.ng = ng
+
+        # "flux" is not swept, and `unrelated_tmon` is not part of the Hilbert space
+        sweep = ParameterSweep(
+            hilbertspace=hilbertspace,
+            paramvals_by_name={"ng": np.linspace(0.0, 0.5, 3)},
+            update_hilbertspace=update_hilbertspace,
+            evals_count=6,
+            subsys_update_info={"ng": [tmon, unrelated_tmon], "flux": [tmon]},
+            num_cpus=num_cpus,
+        )
+        assert sweep.dressed_index((1, 0), param_indices=(0,)) is not None
+        bare_evals = sweep["bare_evals"]["subsys":0].toarray()
+        assert not np.allclose(bare_evals[0], bare_evals[-1])
+
     def test_ParameterSweep_fileIO(self, num_cpus):
         sweep = self.initialize(num_cpus)
         sweep.filewrite(self.tmpdir + "test.h5")
@@ -12,8 +12,10 @@
 ############################################################################
 
 import numpy as np
+import pytest
 
 import scqubits as qubit
+import scqubits.core.spec_lookup as spec_lookup
 
 from scqubits.core.hilbert_space import HilbertSpace
 from scqubits.core.param_sweep import ParameterSweep
@@ -61,6 +63,15 @@ class TestSpectrumLookup:
         hilbertspace = self.initialize_hilbertspace()
         hilbertspace.generate_lookup()
 
+    def test_hilbertspace_generate_lookup_reduced_dimension(self):
+        hilbertspace = self.initialize_hilbertspace()
+        hilbertspace.generate_lookup()
+        hilbertspace[1].truncated_dim = 3
+        hilbertspace.generate_lookup()
+        dressed_indices = hilbertspace["dressed_indices"][0]
+        assert len(dressed_indices) == hilbertspace.dimension
+        assert np.all(dressed_indices < len(hilbertspace["evecs"][0]))
+
     def test_hilbertspace_lookup_bare_eigenenergies(self):
         hilbertspace = self.initialize_hilbertspace()
         hilbertspace.generate_lookup()
@@ -174,7 +185,7 @@ class TestSpectrumLookup:
 
 
 class TestParameterSweep:
-    def initialize(self):
+    def initialize(self, lazy_lookup=False):
         # Set up the components / subspaces of our Hilbert space
         # Set up the components / subspaces of our Hilbert space
 
@@ -229,6 +240,7 @@ class TestParameterSweep:
             hilbertspace=hilbertspace,
             subsys_update_info=subsys_update_info,
             update_hilbertspace=update_hilbertspace,
+            lazy_lookup=lazy_lookup,
         )
         return sweep
 
@@ -326,3 +338,95 @@ class TestParameterSweep:
             ]
         )
         assert np.allclose(reference, sweep["bare_evecs"]["subsys":0][21])
+
+    def test_sweep_lookup_unassigned_dressed_index(self):
+        sweep = self.initialize()
+        assert sweep.dressed_index((2, 3, 3), param_indices=(15,)) is None
+        assert np.all(sweep[:].dressed_index((2, 3, 3)) == -1)
+
+    def test_sweep_lazy_lookup(self):
+        sweep = self.initialize()
+        lazy_sweep = self.initialize(lazy_lookup=True)
+        assert list(lazy_sweep.keys()) == list(sweep.keys())
+        assert lazy_sweep.dressed_index(
+            (1, 0, 1), param_indices=(21,)
+        ) == sweep.dressed_index((1, 0, 1), param_indices=(21,))
+        assert np.count_nonzero(lazy_sweep._lookup_computed) == 1
+        assert np.array_equal(lazy_sweep["dressed_indices"], sweep["dressed_indices"])
+        assert np.allclose(
+            lazy_sweep["chi"][0, 2].toarray(),
+            sweep["chi"][0, 2].toarray(),
+            equal_nan=True,
+        )
+
+    def test_sweep_lazy_lookup_changed_dimension(self):
+        sweep = self.initialize()
+        lazy_sweep = self.initialize(lazy_lookup=True)
+        for each_sweep in (sweep, lazy_sweep):
+            each_sweep.hilbertspace[2].truncated_dim = 3
+        with pytest.warns(Warning, match="outdated"):
+            dressed_index = sweep.dressed_index((1, 1, 1), param_indices=(1,))
+        with pytest.warns(Warning, match="outdated"):
+            lazy_dressed_index = lazy_sweep.dressed_index((1, 1, 1), param_indices=(1,))
+        assert lazy_dressed_index == dressed_index
+
+    def test_sweep_dressed_indices_array(self):
+        sweep = self.initialize()
+        dressed_indices = sweep.dressed_indices_array(param_indices=(21,))
+        for position, bare_labels in enumerate(sweep._bare_product_states_labels):
+            dressed_index = sweep.dressed_index(bare_labels, param_indices=(21,))
+            assert dressed_indices[position] == (
+                -1 if dressed_index is None else dressed_index
+            )
+        assert np.array_equal(
+            sweep[10:20].dressed_indices_array(), sweep["dressed_indices"][10:20]
+        )
+
+
+class TestDressedIndexAssignment:
+    def test_dressed_indices_from_overlaps(self):
+        overlaps_sq = np.asarray(
+            [
+                # dressed states 0 and 1 contest bare state 1: greedy fallback
+                [[0.1, 0.7, 0.2, 0.0], [0.0, 0.6, 0.3, 0.1], [0.6, 0.1, 0.2, 0.1]],
+                # no contested bare states: fast path, including a tie in last row
+                [[0.9, 0.05, 0.05, 0.0], [0.05, 0.05, 0.9, 0.0], [0.2, 0.3, 0.2, 0.3]],
+            ],
+            dtype=np.float32,
+        )
+        expected = {
+            False: [[2, 0, -1, -1], [0, -1, 1, -1]],
+            True: [[2, 0, 1, -1], [0, 2, 1, -1]],
+        }
+        for ignore_low_overlap in (False, True):
+            hilbertspace = HilbertSpace(
+                [qubit.Oscillator(E_osc=1.0, truncated_dim=4)],
+                ignore_low_overlap=ignore_low_overlap,
+            )
+            dressed_indices = hilbertspace._dressed_indices_from_overlaps(overlaps_sq)
+            assert np.array_equal(dressed_indices, expected[ignore_low_overlap])
+            for overlaps_sq_single, dressed_indices_single in zip(
+                overlaps_sq, dressed_indices
+            ):
+                assert np.array_equal(
+                    dressed_indices_single,
+                    spec_lookup._greedy_dressed_indices_numpy(
+                        overlaps_sq_single, 0.5, ignore_low_overlap
+                    ),
+                )
+
+    def test_greedy_dressed_indices_jit_matches_numpy(self):
+        pytest.importorskip("numba")
+        greedy_jit = spec_lookup._greedy_dressed_indices_jit()
+        random_state = np.random.RandomState(42)
+        for _ in range(200):
+            overlaps_sq = random_state.rand(6, 8).astype(np.float32)
+            # let dressed states 0 and 1 contest the same bare state
+            overlaps_sq[:2, 3] = [0.9, 0.95]
+            for ignore_low_overlap in (False, True):
+                assert np.array_equal(
+                    greedy_jit(overlaps_sq, 0.5, ignore_low_overlap),
+                    spec_lookup._greedy_dressed_indices_numpy(
+                        overlaps_sq, 0.5, ignore_low_overlap
+                    ),
+                )
@@ -144,22 +144,19 @@ class Required:
         return decorated_func
 
 
-def check_sync_status(func: Callable) -> Callable:
-    @functools.wraps(func)
-    def wrapper(self, *args, **kwargs):
-        if self._out_of_sync:
-            with warnings.catch_warnings():
-                warnings.simplefilter("always")
-                warnings.warn(
-                    "[scqubits] Some system parameters have been changed and"
-                    " generated spectrum data could be outdated, potentially leading to"
-                    " incorrect results. Spectral data can be refreshed via"
-                    " <HilbertSpace>.generate_lookup() or <ParameterSweep>.run()",
-                    Warning,
-                )
-        return func(self, *args, **kwargs)
-
-    return wrapper
+def warn_out_of_sync() -> None:
+    """Issue warning that spectral data may be outdated. To keep the overhead of
+    lookup methods low, callers check the `_out_of_sync` flag themselves and only
+    invoke this function when it is set."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        warnings.warn(
+            "[scqubits] Some system parameters have been changed and"
+            " generated spectrum data could be outdated, potentially leading to"
+            " incorrect results. Spectral data can be refreshed via"
+            " <HilbertSpace>.generate_lookup() or <ParameterSweep>.run()",
+            Warning,
+        )
 
 
 def check_lookup_exists(func: Callable) -> Callable:
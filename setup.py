@@ -69,6 +69,7 @@ EXTRAS_REQUIRE = {
     "h5-support": ["h5py (>=2.10)"],
     "pathos": ["pathos", "dill"],
     "fitting": ["lmfit"],
+    "numba": ["numba"],
 }
 
 TESTS_REQUIRE = ["h5py (>=2.7.1)", "pathos", "dill", "ipywidgets", "pytest", "lmfit"]